@@ -8,20 +8,26 @@ Time: 23:09:09
 """
 
 from sdk_config import CHOICES, UNKNOWN, ROOT
+from sdk_config import CHOICE_BIT, BIT_TO_CHAR, ALL_MASK
 from sdk_config import NROWS, NCOLS
-from typing import Sequence, List, Set
+from typing import Sequence, List, Dict, Deque, Set, FrozenSet, Optional, Tuple
+from typing import MutableMapping
+from collections import deque
+from multiprocessing import Pool
 import enum
+import os
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
+# Debug logging is opt-in; set SDK_DEBUG in the environment to enable it
+if os.environ.get("SDK_DEBUG"):
+    log.setLevel(logging.DEBUG)
 
 class Event(object):
     """Abstract base class of all events, both for MVC
     and for other purposes.
     """
-    pass
+    __slots__ = ()
 
 class Listener(object):
     """Abstract base class for listeners.
@@ -49,6 +55,8 @@ class TileEvent(Event):
     subclasses indicate the nature of the event.
     """
 
+    __slots__ = ('tile', 'kind')
+
     def __init__(self, tile: 'Tile', kind: EventKind):
         self.tile = tile
         self.kind = kind
@@ -66,6 +74,7 @@ class TileListener(Listener):
 
 class Listenable:
     """Objects to which listeners (like a view component) can be attached"""
+    __slots__ = ('listeners',)
 
     def __init__(self):
         self.listeners = [ ]
@@ -74,9 +83,19 @@ class Listenable:
         self.listeners.append(listener)
 
     def notify_all(self, event: Event):
+        if not self.listeners:
+            return
         for listener in self.listeners:
             listener.notify(event)
 
+# Number of values in each candidate mask, so counting them is a
+# table lookup (int.bit_count needs Python 3.10)
+POPCOUNT = tuple(bin(mask).count("1") for mask in range(ALL_MASK + 1))
+
+# Candidate sets are shared, immutable, and built at most once
+# per distinct mask
+_CANDIDATE_SETS: Dict[int, FrozenSet[str]] = { }
+
 class Tile(Listenable):
     """One tile on the Sudoku grid.
     Public attributes (read-only): value, which will be either
@@ -86,24 +105,91 @@ class Tile(Listenable):
     value.  If candidates is empty, then no tile value can
     be consistent with other tile values in the grid.
     value is a public read-only attribute; change it
-    only through the access method set_value or indirectly 
-    through method remove_candidates.   
+    only through the access methods set_value or place, or
+    indirectly through method remove_candidates.   
+    solved is True iff value is an element of CHOICES.
+    Internally the candidates are kept in cand_mask, a
+    bitmask with one bit per symbol (see CHOICE_BIT).
+    groups are the Groups containing this tile.  They are
+    told directly when the tile is placed or unplaced, without
+    going through listeners, so changes that don't place or
+    unplace a value cost nothing unless a listener is attached.
     """
+    __slots__ = ('row', 'col', 'value', 'cand_mask', 'solved', 'groups')
+
     def __init__(self, row: int, col: int, value=UNKNOWN):
         super().__init__()
         assert value == UNKNOWN or value in CHOICES
         self.row = row
         self.col = col
+        self.solved = False
+        self.groups: List['Group'] = [ ]
         self.set_value(value)
 
     def set_value(self, value: str):
         if value in CHOICES:
-            self.value = value
-            self.candidates = {value}
-        else:
-            self.value = UNKNOWN
-            self.candidates = set(CHOICES)
-        self.notify_all(TileEvent(self, EventKind.TileChanged))
+            self.place(CHOICE_BIT[value])
+            return
+        self._unplace(ALL_MASK)
+
+    def _unplace(self, cand_mask: int):
+        """Make this tile unknown, with candidates cand_mask"""
+        was_solved = self.solved
+        self.value = UNKNOWN
+        self.cand_mask = cand_mask
+        self.solved = False
+        if was_solved:
+            # Each group queues its unknowns, this tile among them
+            for group in self.groups:
+                group.recount()
+        elif self.groups:
+            # The candidates may have widened, so they must be
+            # checked again; the groups share one queue
+            self.groups[0].tile_reset(self)
+        if self.listeners:
+            self.notify_all(TileEvent(self, EventKind.TileChanged))
+
+    def place(self, bit: int):
+        """Set the value of this tile from its bit in a candidate
+        mask (see CHOICE_BIT).  This is how the solver places
+        values; the symbol is looked up only to keep value current.
+        """
+        was_solved = self.solved
+        self.value = BIT_TO_CHAR[bit]
+        self.cand_mask = bit
+        self.solved = True
+        for group in self.groups:
+            if was_solved:
+                group.recount()
+            else:
+                group.tile_placed(self)
+        if self.listeners:
+            self.notify_all(TileEvent(self, EventKind.TileChanged))
+
+    def set_candidates(self, cand_mask: int):
+        """Set the candidates of this tile from a bitmask, as when
+        restoring saved board state.  A mask with a single bit
+        places that value.
+        """
+        if cand_mask and cand_mask & (cand_mask - 1) == 0:
+            self.place(cand_mask)
+            return
+        self._unplace(cand_mask)
+
+    @property
+    def candidates(self) -> FrozenSet[str]:
+        """The candidate symbols, as a set drawn from CHOICES"""
+        candidates = _CANDIDATE_SETS.get(self.cand_mask)
+        if candidates is None:
+            symbols = [ ]
+            remaining = self.cand_mask
+            while remaining:
+                bit = remaining & -remaining # Lowest set bit
+                remaining ^= bit
+                symbols.append(BIT_TO_CHAR[bit])
+            candidates = frozenset(symbols)
+            _CANDIDATE_SETS[self.cand_mask] = candidates
+        return candidates
 
     def __repr__(self) -> str:
         return "Tile({}, {}, '{}')".format(self.row,self.col, self.value)
@@ -113,57 +199,177 @@ class Tile(Listenable):
 
     def could_be(self, value: str) -> bool:
         """True iff value is a candidate value for this tile"""
-        return value in self.candidates
+        return bool(self.cand_mask & CHOICE_BIT[value])
 
-    def remove_candidates(self, used_values: Set[str]):
+    def remove_candidates(self, used_mask: int):
         """
         The used values cannot be a value of this unknown tile.
         We remove those possibilities from the list of candidates.
+        used_mask is a bitmask of used values (see CHOICE_BIT).
         If there is exactly one candidate left, we set the
         value of the tile.
         Returns:  True means we eliminated at least one candidate,
-        False means nothing changed (none of the 'used_values' was
-        in our candidates set).
+        False means nothing changed (none of the used values was
+        among our candidates).
         """
-        new_candidates = self.candidates.difference(used_values)
-        if new_candidates == self.candidates:
+        new_mask = self.cand_mask & ~used_mask
+        if new_mask == self.cand_mask:
             # Didn't remove any candidates
             return False
-        self.candidates = new_candidates
-        if len(self.candidates) == 1:
-            self.set_value(new_candidates.pop())
-        self.notify_all(TileEvent(self, EventKind.TileChanged))
+        if new_mask and new_mask & (new_mask - 1) == 0:
+            # Exactly one bit left; place() notifies listeners
+            self.place(new_mask)
+            return True
+        self.cand_mask = new_mask
+        if self.listeners:
+            self.notify_all(TileEvent(self, EventKind.TileChanged))
         return True
 
+class TileQueue(object):
+    """First-in, first-out queue of tiles in which each tile
+    is held at most once; adding a tile that is already
+    waiting does nothing.
+    """
+
+    def __init__(self, tiles: Sequence[Tile] = ()):
+        self._queue: Deque[Tile] = deque()
+        self._waiting: Set[Tile] = set()
+        self.extend(tiles)
+
+    def extend(self, tiles: Sequence[Tile]):
+        for tile in tiles:
+            if tile not in self._waiting:
+                self._waiting.add(tile)
+                self._queue.append(tile)
+
+    def popleft(self) -> Tile:
+        tile = self._queue.popleft()
+        self._waiting.discard(tile)
+        return tile
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+class Group(object):
+    """A row, column, or block of tiles.  The group is told
+    by its own tiles (through Tile.groups) when they are placed
+    or unplaced, to keep two summaries current: used_mask, the
+    bitmask of values placed in the group, and unknowns, the
+    tiles not yet placed.  The group holds a duplicate value
+    exactly when it has more placed tiles than bits in used_mask.
+    When a value is placed, the group's remaining unknown
+    tiles are appended to dirty, the queue of tiles whose
+    candidates should be checked again.
+    Iterating a group iterates its tiles.
+    """
+
+    def __init__(self, tiles: List[Tile], dirty: TileQueue):
+        self.tiles = tiles
+        self.dirty = dirty
+        self._recount()
+        for tile in tiles:
+            tile.groups.append(self)
+
+    def _recount(self):
+        """Rebuild the summaries from scratch"""
+        self.used_mask = 0
+        self.unknowns: List[Tile] = [ ]
+        for tile in self.tiles:
+            if tile.solved:
+                self.used_mask |= tile.cand_mask
+            else:
+                self.unknowns.append(tile)
+
+    def __iter__(self):
+        return iter(self.tiles)
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+    def __repr__(self) -> str:
+        return repr(self.tiles)
+
+    def is_consistent(self) -> bool:
+        """No value is placed twice in this group"""
+        return POPCOUNT[self.used_mask] == len(self.tiles) - len(self.unknowns)
+
+    def tile_placed(self, tile: Tile):
+        """The usual case: an unknown tile has just been placed"""
+        self.unknowns.remove(tile)
+        self.used_mask |= tile.cand_mask
+        self.dirty.extend(self.unknowns)
+
+    def tile_reset(self, tile: Tile):
+        """An unknown tile's candidates were reset, e.g., to
+        all of CHOICES; queue it to be checked again.
+        """
+        self.dirty.extend((tile,))
+
+    def recount(self):
+        """A placed tile was changed or reset, e.g., restoring
+        a saved board; rare enough to rebuild the summaries.
+        """
+        self._recount()
+        self.dirty.extend(self.unknowns)
+
+# Flat tile indexes (row * NCOLS + col) of the tiles in each
+# group, computed once for the configured board dimensions
+BOX_IDX = tuple(tuple((ROOT * block_row + row) * NCOLS + ROOT * block_col + col
+                      for row in range(ROOT) for col in range(ROOT))
+                for block_row in range(ROOT) for block_col in range(ROOT))
+ROW_IDX = tuple(tuple(row * NCOLS + col for col in range(NCOLS))
+                for row in range(NROWS))
+COL_IDX = tuple(tuple(row * NCOLS + col for row in range(NROWS))
+                for col in range(NCOLS))
+
+# Each place a block crosses a row or column, as flat indexes of
+# (tiles in both, rest of the block, rest of the row or column)
+LOCKED_IDX = tuple((tuple(i for i in box if i in line),
+                    tuple(i for i in box if i not in line),
+                    tuple(i for i in line if i not in box))
+                   for box in BOX_IDX for line in ROW_IDX + COL_IDX
+                   if set(box) & set(line))
+
 class Board(object):
     """A board has a matrix of tiles"""
 
-    def __init__(self):
-        """The empty board"""
-        self.groups: List[List[[Tile]]] = [ ]
+    def __init__(self, tile_values: Optional[Sequence[Sequence[str]]] = None):
+        """The empty board, or a board with tile_values in
+        any form accepted by set_tiles.  Passing the values
+        here sets each tile once, as it is built, rather than
+        building an empty board and resetting every tile.
+        """
+        if tile_values is None:
+            self.flat: List[Tile] = [Tile(i // NCOLS, i % NCOLS)
+                                     for i in range(NROWS * NCOLS)]
+        else:
+            self.flat = [ ]
+            for row in range(NROWS):
+                for col in range(NCOLS):
+                    value = tile_values[row][col]
+                    if value not in CHOICES:
+                        value = UNKNOWN
+                    self.flat.append(Tile(row, col, value))
+        # Tiles to be checked by the next naked_single pass
+        self.dirty = TileQueue(self.flat)
         # Row/Column structure: Each row contains columns
-        self.tiles: List[List[Tile]] = [ ]
-        for row in range(NROWS):
-            cols = [ ]
-            for col in range(NCOLS):
-                cols.append(Tile(row, col))
-            self.tiles.append(cols)  
-        for block_row in range(ROOT):
-            for block_col in range(ROOT):
-                group = [ ] 
-                for row in range(ROOT):
-                    for col in range(ROOT):
-                        row_addr = (ROOT * block_row) + row
-                        col_addr = (ROOT * block_col) + col
-                        group.append(self.tiles[row_addr][col_addr])
-                self.groups.append(group)
-        for row in self.tiles: 
-            self.groups.append(row)
-        for row in range(len(self.tiles)):
-            columns = [ ]
-            for col in range(NCOLS):
-                columns.append(self.tiles[col][row])
-            self.groups.append(columns)
+        self.tiles: List[List[Tile]] = [self.flat[row * NCOLS:(row + 1) * NCOLS]
+                                        for row in range(NROWS)]
+        self.boxes: List[Group] = [Group([self.flat[i] for i in idx], self.dirty)
+                                   for idx in BOX_IDX]
+        self.rows: List[Group] = [Group([self.flat[i] for i in idx], self.dirty)
+                                  for idx in ROW_IDX]
+        self.cols: List[Group] = [Group([self.flat[i] for i in idx], self.dirty)
+                                  for idx in COL_IDX]
+        self.groups: List[Group] = self.boxes + self.rows + self.cols
+        # The (row, column, block) groups of each tile, by flat index
+        self.tile_groups: List[Tuple[Group, Group, Group]] = [
+            (self.rows[tile.row], self.cols[tile.col],
+             self.boxes[(tile.row // ROOT) * ROOT + tile.col // ROOT])
+            for tile in self.flat]
+        self.intersections: List[Tuple[Tuple[Tile, ...], ...]] = [
+            tuple(tuple(self.flat[i] for i in part) for part in parts)
+            for parts in LOCKED_IDX]
 
     def set_tiles(self, tile_values: Sequence[Sequence[str]] ):
         """Set the tile values a list of lists or a list of strings"""
@@ -186,6 +392,22 @@ class Board(object):
             values = [tile.value for tile in row]
             row_syms.append("".join(values))
         return row_syms
+
+    def candidate_masks(self) -> List[int]:
+        """Candidate masks of all tiles, in row-major order.
+        Unlike as_list, this saves the candidates of unknown
+        tiles too; restore with set_candidate_masks.
+        """
+        return [tile.cand_mask for tile in self.flat]
+
+    def set_candidate_masks(self, masks: Sequence[int]):
+        """Restore masks saved by candidate_masks.  Only tiles
+        that differ from the saved state are changed, so undoing
+        a few moves costs a few tile updates.
+        """
+        for tile, mask in zip(self.flat, masks):
+            if tile.cand_mask != mask:
+                tile.set_candidates(mask)
     
     def is_consistent(self) -> bool:
         """
@@ -194,35 +416,31 @@ class Board(object):
         Return value False if duplicate is found on board.
         """
         for group in self.groups:
-            used_symbols = set()
-            for tile in group:
-                if tile.value in CHOICES:
-                    if tile.value in used_symbols: # If tile.value is more than once to used_symbols
-                        return False
-                    else:
-                        used_symbols.add(tile.value)
+            if not group.is_consistent():
+                return False
         return True
 
     def naked_single(self) -> bool:
         """Eliminate candidates and check for sole remaining possibilities.
+        Only the tiles queued in self.dirty are checked; tiles
+        queued during this pass, because a peer was placed, wait
+        for the next pass.
         Return value True means we crossed off at least one candidate.
         Return value False means we made no progress.
         """
-        candidate_set_before = 0 # No changes to candidate set, progress is False
-        for group in self.groups:
-            used_values = set()
-            for tile in group: # Adds the currently used values within the group to a set
-                if tile.value in CHOICES:
-                    used_values.add(tile.value)
-            for tile in group: # Loops through tiles and remove a candidate if that candidate is already a value placed on the board
-                if tile.value in UNKNOWN and len(used_values) > 0:
-                    if Tile.remove_candidates(tile, used_values): # Removes values from candidates so there are no duplicates in the group
-                        candidate_set_before += 1 # Change to candidate set, progress is True
-        candidate_set_after = candidate_set_before
-        if candidate_set_after > 0: # If at least one change was made to a tile's value, return value is True
-            return True
-        else:
-            return False # If no changes were made to any tiles, return value is False
+        progress = False
+        # Local names for the loop's lookups
+        popleft = self.dirty.popleft
+        tile_groups = self.tile_groups
+        ncols = NCOLS
+        for _ in range(len(self.dirty)):
+            tile = popleft()
+            if tile.solved:
+                continue
+            row, col, box = tile_groups[tile.row * ncols + tile.col]
+            if tile.remove_candidates(row.used_mask | col.used_mask | box.used_mask):
+                progress = True
+        return progress
         
     def hidden_single(self) -> bool:
         """
@@ -240,55 +458,86 @@ class Board(object):
         Return value False if no value was placed on a tile 
         (marking we *did not make* progress).
         """
-        tile_to_change = None # Stores the tile with a sole candidate within the group
+        progress = False
         for group in self.groups:
-            set_tile = 0 # No changes were made to any tile values
-            leftovers = set(CHOICES)
-            for tile in group: # Loops through tile values already placed in group and removes them from possibilities
-                if tile.value in CHOICES:
-                    if tile.value in leftovers:
-                        leftovers.remove(tile.value)
-            for value in leftovers: # Loops through values that can be placed and counts how many times that value is in a candidate set
-                count = 0
-                for tile in group:
-                    if value in tile.candidates:
-                        count += 1
-                        tile_to_change = tile
-                if count < 2 and count > 0:
-                    tile_to_change.set_value(value)
-                    tile_to_change.notify_all(TileEvent(tile_to_change, EventKind.TileChanged))
-                    set_tile += 1 # A change was made to a tile value
-        if set_tile > 0: # If a change was made to at least one tile value, return value True
-            return True
-        else:
-            return False
+            once = 0 # Values that are candidates of at least one unknown tile
+            twice = 0 # Values that are candidates of at least two unknown tiles
+            for tile in group.unknowns:
+                twice |= once & tile.cand_mask
+                once |= tile.cand_mask
+            hidden = once & ~twice & ~group.used_mask
+            while hidden:
+                bit = hidden & -hidden # Lowest remaining value
+                hidden ^= bit
+                for tile_to_change in group.unknowns:
+                    if tile_to_change.cand_mask & bit:
+                        tile_to_change.place(bit)
+                        progress = True
+                        break
+        return progress
     
         
+    def locked_candidates(self) -> bool:
+        """
+        Where a block crosses a row or column, if a value can
+        go only in the crossing tiles within the block, then
+        the value must go there, so we remove it from the
+        rest of the row or column ("pointing").  Likewise if
+        the value can go only in the crossing tiles within the
+        row or column, we remove it from the rest of the block
+        ("claiming").
+
+        Return value True means we crossed off at least one candidate.
+        Return value False means we made no progress.
+        """
+        progress = False
+        for inside, block_rest, line_rest in self.intersections:
+            inside_mask = 0
+            for tile in inside:
+                if not tile.solved:
+                    inside_mask |= tile.cand_mask
+            if not inside_mask:
+                continue
+            # Placed tiles count too: a value placed elsewhere
+            # is not confined to the crossing
+            block_mask = 0
+            for tile in block_rest:
+                block_mask |= tile.cand_mask
+            line_mask = 0
+            for tile in line_rest:
+                line_mask |= tile.cand_mask
+            pointing = inside_mask & ~block_mask
+            if pointing & line_mask:
+                for tile in line_rest:
+                    if not tile.solved and tile.remove_candidates(pointing):
+                        progress = True
+            claiming = inside_mask & ~line_mask
+            if claiming & block_mask:
+                for tile in block_rest:
+                    if not tile.solved and tile.remove_candidates(claiming):
+                        progress = True
+        return progress
+
     def min_choice_tile(self) -> Tile: 
         """Returns a tile with value UNKNOWN and 
         minimum number of candidates. 
         Precondition: There is at least one tile 
         with value UNKNOWN. 
         """
-        unknowns_in_board = False # Pre-condition: must contain unknown ('.') values
-        min_candidates_tile = 8 # Start at max amount of candidates -> 0 to 8 possible candidates
-        min_tile = Tile
-        for group in self.groups:
-            for tile in group: # Confirms pre-condition is met
-                if tile.value in UNKNOWN:
-                    unknowns_in_board = True
-                else:
-                    unknowns_in_board = False # This line is critical in order to continue the loop
-            for tile in group:
-                # Iterate through tiles in each group
-                # and change min_tile if corresponding tile 
-                # has less candidates than the currently stored tile
-                if unknowns_in_board and tile.value in UNKNOWN:
-                    if len(tile.candidates) < min_candidates_tile:
-                        min_tile = tile
-                        min_candidates_tile = len(tile.candidates)
-        if unknowns_in_board: # Must finish looping through all tiles, return value is Tile with unknown value '.'
-            return min_tile
+        min_tile = None
+        min_candidates = len(CHOICES) + 1
+        for tile in self.flat:
+            if tile.solved:
+                continue
+            n_candidates = POPCOUNT[tile.cand_mask]
+            if n_candidates < min_candidates:
+                min_tile = tile
+                min_candidates = n_candidates
+                if n_candidates <= 2:
+                    # An unknown tile normally has at least two
+                    # candidates, so we can't do better
+                    break
+        return min_tile
 
     def is_complete(self) -> bool:
         """None of the tiles are UNKNOWN.  
@@ -296,32 +545,97 @@ class Board(object):
         separately with is_consistent.
         """
         for group in self.groups:
-            for tile in group:
-                if tile.value in UNKNOWN:
-                    return False
+            if group.unknowns:
+                return False
         return True
+
+    def check_state(self) -> Tuple[bool, bool]:
+        """Both checks in one walk over the groups:
+        (is_consistent(), is_complete()), except that an
+        inconsistent board is reported as (False, False)
+        without looking at the remaining groups.
+        """
+        complete = True
+        for group in self.groups:
+            unknowns = group.unknowns
+            if POPCOUNT[group.used_mask] != len(group.tiles) - len(unknowns):
+                return False, False
+            if unknowns:
+                complete = False
+        return True, complete
             
-    def solve(self):
+    def solve(self) -> bool:
         """General solver; guess-and-check 
         combined with constraint propagation.
+        The search is iterative.  Each guess is a frame holding
+        the candidate masks saved before the guess, the tile
+        guessed, and the mask of its values not yet tried.
+        Backtracking restores the saved masks, which touches
+        only the tiles changed since the guess.
+        Returns True if the board is solved; otherwise False,
+        with the board as it was after the first propagation.
         """
-        self.propagate()
-        if self.is_complete():
-            return True
-        elif not self.is_consistent():
-            return False
-        else:
-            saved_board = self.as_list()
-            guess_tile = self.min_choice_tile()
-            candidates = guess_tile.candidates
-            for value in candidates:
-                guess_tile.set_value(value)
-                if self.solve():
-                    return True
-                else:
-                    self.set_tiles(saved_board)
-            return False
+        guesses: List[Tuple[List[int], Tile, int]] = [ ]
+        while True:
+            self.propagate()
+            consistent, complete = self.check_state()
+            if not consistent:
+                pass # Dead end; back up to an untried guess below
+            elif complete:
+                return True
+            else:
+                guess_tile = self.min_choice_tile()
+                guesses.append((self.candidate_masks(), guess_tile, guess_tile.cand_mask))
+            # Discard guesses with no values left to try
+            while guesses and not guesses[-1][2]:
+                saved, _, _ = guesses.pop()
+                self.set_candidate_masks(saved)
+            if not guesses:
+                return False
+            saved, guess_tile, untried = guesses[-1]
+            bit = untried & -untried # Lowest untried value
+            guesses[-1] = (saved, guess_tile, untried ^ bit)
+            self.set_candidate_masks(saved)
+            guess_tile.place(bit)
         
+    def solve_silent(self) -> bool:
+        """Solve with the tiles' listeners (e.g., a view) detached,
+        so the search sends them no events.  When the search ends
+        each detached listener is reattached and notified once of
+        its tile's final state.
+        """
+        detached = [ ]
+        for tile in self.flat:
+            if tile.listeners:
+                detached.append((tile, tile.listeners))
+                tile.listeners = [ ]
+        try:
+            return self.solve()
+        finally:
+            for tile, listeners in detached:
+                tile.listeners = listeners
+                event = TileEvent(tile, EventKind.TileChanged)
+                for listener in listeners:
+                    listener.notify(event)
+
+    def solve_cached(self, cache: MutableMapping[str, List[str]]) -> bool:
+        """Solve, looking the puzzle up first in cache, a mapping
+        from a puzzle (str of the board) to its solution (as_list
+        of the solved board), e.g., an open shelve.Shelf.  A puzzle
+        found in the cache is filled in without searching; a puzzle
+        solved here is added to it.  Unsolvable puzzles are not
+        cached.
+        """
+        key = str(self)
+        solution = cache.get(key)
+        if solution is not None:
+            self.set_tiles(solution)
+            return True
+        if self.solve():
+            cache[key] = self.as_list()
+            return True
+        return False
+
     def propagate(self):
         """Repeat solution tactics until we
         don't make any progress, whether or not
@@ -330,6 +644,44 @@ class Board(object):
         progress = True
         while progress:
             progress = self.naked_single()
-            self.hidden_single()
+            progress = self.locked_candidates() or progress
+            progress = self.hidden_single() or progress
         return
 
+
+def solve_all(puzzles: Sequence[Sequence[Sequence[str]]]) -> List[Optional[List[str]]]:
+    """Solve a batch of puzzles, each given in a form accepted
+    by Board.set_tiles.  One board is built and reused for the
+    whole batch, so per-puzzle cost is just setting tiles and
+    solving.  Returns, for each puzzle in order, the solved
+    board in the form of Board.as_list, or None if that puzzle
+    could not be solved.
+    """
+    board = Board()
+    solutions = [ ]
+    for puzzle in puzzles:
+        board.set_tiles(puzzle)
+        if board.is_consistent() and board.solve():
+            solutions.append(board.as_list())
+        else:
+            solutions.append(None)
+    return solutions
+
+
+def solve_many(puzzles: Sequence[Sequence[Sequence[str]]],
+               processes: Optional[int] = None,
+               chunksize: int = 64) -> List[Optional[List[str]]]:
+    """Solve a large batch of puzzles across a pool of worker
+    processes.  Puzzles are handed out in chunks of chunksize,
+    and each worker solves its chunk with solve_all, so a board
+    is built once per chunk rather than once per puzzle.
+    Results are returned in the same order and form as solve_all.
+    processes defaults to the number of CPUs.
+    """
+    chunks = [puzzles[i:i + chunksize]
+              for i in range(0, len(puzzles), chunksize)]
+    solutions = [ ]
+    with Pool(processes) as pool:
+        for chunk_solutions in pool.imap(solve_all, chunks):
+            solutions.extend(chunk_solutions)
+    return solutions
@@ -27,6 +27,13 @@ PENCIL = ["123", "456", "789"]
 # One symbol, not in Choices, for Unknown
 UNKNOWN = "."
 
+# Candidate sets are kept as bitmasks: bit i set means
+# CHOICES[i] is still possible.  ALL_MASK has a bit for
+# every symbol in CHOICES.
+CHOICE_BIT = {sym: 1 << i for i, sym in enumerate(CHOICES)}
+BIT_TO_CHAR = {bit: sym for sym, bit in CHOICE_BIT.items()}
+ALL_MASK = (1 << len(CHOICES)) - 1
+
 # ---------- Configuration of the graphical view component ---
 
 # Display options
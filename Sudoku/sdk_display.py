@@ -29,7 +29,6 @@ import graphics.grid
 import graphics.graphics
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
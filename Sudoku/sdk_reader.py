@@ -12,7 +12,6 @@ from typing import List, Union
 from io import IOBase
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
@@ -33,8 +32,6 @@ def read(f: Union[IOBase, str],
         f = open(f, "r")
     else:
         log.debug(f"Reading from file {f}")
-    if board is None:
-        board = sdk_board.Board()
     values = []
     for row in f:
         row = row.strip()
@@ -47,7 +44,10 @@ def read(f: Union[IOBase, str],
     if len(values) != NROWS:
         raise InputError("Wrong number of rows in {}"
                          .format(values))
-    board.set_tiles(values)
+    if board is None:
+        board = sdk_board.Board(values)
+    else:
+        board.set_tiles(values)
     f.close()
     return board
 
@@ -1,11 +1,11 @@
 """Sudoku solver with optional displays"""
 
 import argparse
+import shelve
 import sdk_display
 import sdk_reader
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
@@ -15,6 +15,8 @@ def cli() -> object:
     parser = argparse.ArgumentParser(description="Sudoku solver")
     parser.add_argument("-d", "--display", help="Graphical display",
                         action="store_true")
+    parser.add_argument("-c", "--cache", metavar="CACHE_FILE",
+                        help="Reuse and record solutions in this shelve file")
     parser.add_argument("file", type=argparse.FileType('r'))
     args = parser.parse_args()
     return args
@@ -25,10 +27,13 @@ def main():
     board = sdk_reader.read(args.file)
     if args.display:
         display = sdk_display.Board(board, 800, 800)
-    if board.is_consistent():
-        board.solve()
-    else:
+    if not board.is_consistent():
         print("Board has duplicates; rejected")
+    elif args.cache:
+        with shelve.open(args.cache) as cache:
+            board.solve_cached(cache)
+    else:
+        board.solve()
     print(board)
 
     if args.display:
@@ -38,4 +43,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig()
     main()
@@ -48,6 +48,20 @@ class TestBoardBuild(unittest.TestCase):
         sample_tile = board.tiles[8][8]
         self.assertEqual(sample_tile.value, '8')
 
+    def test_build_with_values(self):
+        """Building a board from values is the same as setting them"""
+        values = ["...26.7.1", "68..7..9.", "19...45..",
+                  "82.1...4.", "..46.29..", ".5...3.28",
+                  "..93...74", ".4..5..36", "7.3.18..."]
+        board = Board(values)
+        self.assertEqual(board.as_list(), values)
+        self.assertTrue(board.is_consistent())
+        board.solve()
+        self.assertEqual(board.as_list(),
+                         ["435269781", "682571493", "197834562",
+                          "826195347", "374682915", "951743628",
+                          "519326874", "248957136", "763418259"])
+
 class TestBoardIO(unittest.TestCase):
 
     def test_read_new_board(self):
@@ -72,6 +86,20 @@ class TestBoardGroups(unittest.TestCase):
         for tile in counts:
             self.assertEqual(counts[tile], 3)
 
+    def test_tile_groups(self):
+        """Each tile's row, column, and block groups hold it"""
+        board = Board()
+        tile = board.tiles[4][7]
+        row, col, box = board.tile_groups[4 * NCOLS + 7]
+        self.assertIs(row, board.rows[4])
+        self.assertIs(col, board.cols[7])
+        self.assertIs(box, board.boxes[5])
+        for group in (row, col, box):
+            self.assertIn(tile, list(group))
+        # Groups follow their tiles directly, not as listeners
+        self.assertEqual(list(tile.groups), [box, row, col])
+        self.assertEqual(tile.listeners, [ ])
+
 def test_groups_are_distinct(self):
         """Each group should contain a distinct set of tiles.
         (A frequent bug in Winter 2019 CIS 211.)
@@ -126,6 +154,32 @@ class TestConsistent(unittest.TestCase):
                          ".........", ".........", "........."])
         self.assertFalse(board.is_consistent())
 
+    def test_tracks_tile_changes(self):
+        """Consistency follows changes to single tiles,
+        not just whole boards loaded with set_tiles.
+        """
+        board = Board()
+        board.tiles[0][0].set_value('5')
+        board.tiles[0][8].set_value('5')
+        self.assertFalse(board.is_consistent())
+        board.tiles[0][8].set_value('6')
+        self.assertTrue(board.is_consistent())
+        board.tiles[8][0].set_value('5')
+        self.assertFalse(board.is_consistent())
+        board.tiles[0][0].set_value(UNKNOWN)
+        self.assertTrue(board.is_consistent())
+
+    def test_check_state(self):
+        board = Board()
+        self.assertEqual(board.check_state(), (True, False))
+        board.tiles[0][0].set_value('5')
+        board.tiles[0][8].set_value('5')
+        self.assertEqual(board.check_state(), (False, False))
+        board.set_tiles(["534678912", "672195348", "198342567",
+                         "859761423", "426853791", "713924856",
+                         "961537284", "287419635", "345286179"])
+        self.assertEqual(board.check_state(), (True, True))
+
 class TestNakedSingle(unittest.TestCase):
     """Simple test of Naked Single using row, column, and block
     constraints.  From Sadman Sudoku,
@@ -178,6 +232,19 @@ class TestHiddenSingle(unittest.TestCase):
                          "....6....", "....2....",  "....8....",
                          ".........", ".........", ".....2..."]))
 
+    def test_hidden_single_progress(self):
+        """hidden_single reports progress made in any group,
+        and no progress once nothing is left to place.
+        """
+        board = Board()
+        board.set_tiles([".........", "...2.....",  ".........",
+                         "....6....", ".........",  "....8....",
+                         ".........", ".........", ".....2..."])
+        board.naked_single()
+        self.assertTrue(board.hidden_single())
+        board = Board()
+        self.assertFalse(board.hidden_single())
+
     def test_hidden_single_solve(self):
         """This puzzle can be solved with naked single
         and hidden single together.
@@ -217,6 +284,18 @@ class TestHiddenSingle(unittest.TestCase):
         self.assertEqual(tile.col, 4)
         self.assertEqual(tile.candidates, set(["6", "7"]))
 
+    def test_choose_min_tile_last_group_full(self):
+        """The choice doesn't depend on the order groups are
+        visited, e.g., when the last column is already full.
+        """
+        board = Board()
+        board.set_tiles(["........1", "........2", "........3",
+                         "........4", "........5", "........6",
+                         "........7", "........8", "........9"])
+        tile = board.min_choice_tile()
+        self.assertIsNotNone(tile)
+        self.assertEqual(tile.value, UNKNOWN)
+
     def test_save_restore(self):
         """as_list and set_tiles should work as saving and
         restoring board state.
@@ -241,5 +320,145 @@ class TestHiddenSingle(unittest.TestCase):
                     "169472853", "758693124", "342581679"]
         self.assertEqual(board.as_list(), solution)
 
+class TestResetTile(unittest.TestCase):
+    """Candidates widened by a reset are pruned again"""
+
+    def test_reset_unknown(self):
+        board = Board(["5........"] + ["........."] * 8)
+        board.naked_single()
+        tile = board.tiles[0][1]
+        self.assertFalse(tile.could_be('5'))
+        tile.set_value(UNKNOWN)
+        self.assertTrue(tile.could_be('5'))
+        self.assertTrue(board.naked_single())
+        self.assertFalse(tile.could_be('5'))
+
+    def test_widen_candidates(self):
+        board = Board(["5........"] + ["........."] * 8)
+        board.propagate()
+        tile = board.tiles[1][1]
+        tile.set_candidates(ALL_MASK)
+        board.propagate()
+        self.assertFalse(tile.could_be('5'))
+
+class TestLockedCandidates(unittest.TestCase):
+    """Locked candidates: a value confined to one row of a block
+    can be removed from the rest of that row (pointing), and a
+    value confined to one block within a row can be removed from
+    the rest of that block (claiming).
+    """
+
+    def test_pointing(self):
+        board = Board()
+        board.set_tiles([".........", "234......", "567......",
+                         ".........", ".........", ".........",
+                         ".........", ".........", "........."])
+        board.naked_single()
+        # In the first block, 1 can only go in the top row
+        self.assertTrue(board.tiles[0][5].could_be('1'))
+        self.assertTrue(board.locked_candidates())
+        self.assertTrue(board.tiles[0][0].could_be('1'))
+        self.assertFalse(board.tiles[0][5].could_be('1'))
+        self.assertFalse(board.tiles[0][8].could_be('1'))
+        self.assertTrue(board.tiles[1][5].could_be('1'))
+
+    def test_claiming(self):
+        board = Board(["...234567"] + ["........."] * 8)
+        board.naked_single()
+        # In the top row, 1 can only go in the first block
+        self.assertTrue(board.tiles[1][0].could_be('1'))
+        self.assertTrue(board.locked_candidates())
+        self.assertTrue(board.tiles[0][0].could_be('1'))
+        for row in (1, 2):
+            for col in range(3):
+                self.assertFalse(board.tiles[row][col].could_be('1'))
+        self.assertTrue(board.tiles[1][3].could_be('1'))
+
+class CountingListener(TileListener):
+    """Counts the events it is sent"""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def notify(self, event: TileEvent):
+        self.count += 1
+
+class TestSolveSilent(unittest.TestCase):
+
+    def test_listeners_hear_final_state_only(self):
+        board = Board()
+        board.set_tiles(["....5..1.", "2........", "5.19..48.",
+                         "6...1.24.", "8.......7", ".23.4...1",
+                         ".69..28.3", "........4", ".4..8...."])
+        listener = CountingListener()
+        board.tiles[0][0].add_listener(listener)
+        self.assertTrue(board.solve_silent())
+        self.assertEqual(listener.count, 1)
+        self.assertEqual(board.tiles[0][0].value, '4')
+        board.tiles[0][0].set_value(UNKNOWN)
+        self.assertEqual(listener.count, 2)
+
+class TestSolveCached(unittest.TestCase):
+    """Solving with a cache of solutions"""
+
+    puzzle = ["...26.7.1", "68..7..9.", "19...45..",
+              "82.1...4.", "..46.29..", ".5...3.28",
+              "..93...74", ".4..5..36", "7.3.18..."]
+
+    def test_records_then_reuses(self):
+        cache = { }
+        board = Board(self.puzzle)
+        self.assertTrue(board.solve_cached(cache))
+        self.assertEqual(cache, {"\n".join(self.puzzle): board.as_list()})
+        # A cached solution is used as is, without searching
+        fake = ["123456789"] * 9
+        cache["\n".join(self.puzzle)] = fake
+        board = Board(self.puzzle)
+        self.assertTrue(board.solve_cached(cache))
+        self.assertEqual(board.as_list(), fake)
+
+    def test_unsolvable_not_cached(self):
+        cache = { }
+        board = Board(["1........", ".........", ".........",
+                       ".........", ".........", ".........",
+                       "1........", ".........", "........."])
+        self.assertFalse(board.solve_cached(cache))
+        self.assertEqual(cache, { })
+
+class TestSolveAll(unittest.TestCase):
+    """Solving a batch of puzzles with one reused board"""
+
+    def test_solve_batch(self):
+        puzzles = [["...26.7.1", "68..7..9.", "19...45..",
+                    "82.1...4.", "..46.29..", ".5...3.28",
+                    "..93...74", ".4..5..36", "7.3.18..."],
+                   ["1........", ".........", ".........",
+                    ".........", ".........", ".........",
+                    "1........", ".........", "........."],
+                   ["....5..1.", "2........", "5.19..48.",
+                    "6...1.24.", "8.......7", ".23.4...1",
+                    ".69..28.3", "........4", ".4..8...."]]
+        solutions = solve_all(puzzles)
+        self.assertEqual(solutions[0],
+                         ["435269781", "682571493", "197834562",
+                          "826195347", "374682915", "951743628",
+                          "519326874", "248957136", "763418259"])
+        self.assertIsNone(solutions[1])
+        self.assertEqual(solutions[2],
+                         ["497856312", "286134795", "531927486",
+                          "675319248", "814265937", "923748561",
+                          "169472853", "758693124", "342581679"])
+
+    def test_solve_many_keeps_order(self):
+        puzzles = [["...26.7.1", "68..7..9.", "19...45..",
+                    "82.1...4.", "..46.29..", ".5...3.28",
+                    "..93...74", ".4..5..36", "7.3.18..."],
+                   ["1........", ".........", ".........",
+                    ".........", ".........", ".........",
+                    "1........", ".........", "........."]] * 3
+        self.assertEqual(solve_many(puzzles, processes=2, chunksize=2),
+                         solve_all(puzzles))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -7,9 +7,17 @@
   """
 
 import argparse
+from functools import lru_cache
 
 error_message = 'Argument not valid. Please use a positive integer.'
 
+_VOWELS = 'aeiou'
+_CONSONANTS = 'bcdfghjklmnpqrstvwyz'
+# The consonant-vowel pair for each two-digit chunk of a pin, 00 to 99
+_PAIRS = [_CONSONANTS[i // 5] + _VOWELS[i % 5] for i in range(100)]
+
+# typed, so that e.g. 52.0 is not answered from the cache entry for 52
+@lru_cache(maxsize=4096, typed=True)
 def alphacode(pin):
     """
     Convert numeric pin code to an
@@ -19,20 +27,16 @@ def alphacode(pin):
     returns:
         mnemonic as string
     """
-    mnemonic = ''
-    vowels = list(''.join('aeiou'))
-    consonants = list(''.join('bcdfghjklmnpqrstvwyz'))  
+    if not isinstance(pin, int):
+        # Positive non-integers are rejected; like negative
+        # integers, other values encode as the empty string
+        return error_message if pin > 0 else ''
+    pairs = []
     while pin > 0:
-        try:
-            i = pin % 100
-            pin = pin // 100
-            remainder = i % 5
-            quotient = i // 5
-            mnemonic += str(vowels[remainder] + consonants[quotient])
-        except TypeError:
-            return error_message
-    if pin < 1:
-        return mnemonic[::-1]
+        pairs.append(_PAIRS[pin % 100])
+        pin = pin // 100
+    # Pairs were found from the low-order digits up
+    return ''.join(reversed(pairs))
 
 def main():
     """
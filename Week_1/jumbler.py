@@ -20,14 +20,21 @@ def jumbler(jumble, wordlist):
     """
     matches = 0
     lines = 0
+    length = len(jumble)
     sorted_jumble = sorted(jumble)
     for word in wordlist:
-        word = word.strip()  # Remove spaces or carriage return at ends
-        sorted_word = sorted(word)
-        if sorted_word == sorted_jumble:
+        lines += 1
+        # Only a word of the same length can be a rearrangement,
+        # so most words are rejected without sorting them
+        if len(word) != length:
+            # Lines from a file keep their line ending; strip
+            # only words that don't already have the right length
+            word = word.strip()
+            if len(word) != length:
+                continue
+        if sorted(word) == sorted_jumble:
             print(word)
             matches += 1
-        lines += 1
 
     print("{} matches in {} lines".format(matches,lines))
 
@@ -59,7 +66,10 @@ def main():
                         help="A text file containing dictionary words, one word per line.")
     args = parser.parse_args()  # gets arguments from command line
     jumble = args.jumble
-    wordlist = args.wordlist
+    # Read the dictionary in one call rather than decoding it a
+    # line at a time; splitlines drops the line endings
+    wordlist = args.wordlist.read().splitlines()
+    args.wordlist.close()
     jumbler(jumble, wordlist)
 
 if __name__ == "__main__":
@@ -31,13 +31,14 @@ class BitField(object):
     def __init__(self, low: int, high:int):
         """
         Takes two integers to indicate
-        low and high bounds of bitfield.
+        low and high bounds of bitfield (inclusive).
         """
         self.low = low
         self.high = high
-        self.width = 2**(self.high + 1)
-        self.mask = self.width - (2**self.low)
-        #self.mask = 1 << self.low
+        self.width = high - low + 1
+        # mask has ones in the field, inv_mask ones everywhere else
+        self.mask = ((1 << self.width) - 1) << low
+        self.inv_mask = ~self.mask
 
     def insert(self, field: int, word: int):
         """
@@ -48,63 +49,17 @@ class BitField(object):
         Example:
         low_4 = BitField(0, 3)
         self.assertEqual(low_4.insert(13, 0), 13)
-        insert word into field
-        """
-        # 13 in binary is 001101
-        # 21 in binary is 010101
-        # 5 in binary is  000101
-        # if word is   xaa00aa00 and
-    #      field_val is x0000000f
-    #      and the field is bits 4..7
-    #      then insert gives xaa00aaf0
-        # if word is 0000
-        # and field_val is 1101
-        # then insert gives 1101
-        # if word is 000000
-        # and field_val is 010101
-        # and the field is bits 0..3
-        # then insert gives 0101
-        if field > self.width:
-            return field & self.mask
-        if word > self.width:
-            return word^self.mask
-        new_word = word | field
-        return new_word & self.mask
-        """
-        new_word = field
-        if new_word < self.width:
-            new_word = field << self.low
-            new_word = new_word & self.mask
-        if word > self.width:
-            new_word = new_word | word
-            return new_word
-        if word < self.width:
-            return new_word & self.mask
-        if new_word > self.width:
-            new_word = (new_word^self.width)
-            new_word = new_word & self.mask
-        return new_word
         """
+        # Clear the old field, then shift the new value into
+        # place; bits of the value that don't fit are masked off
+        return (word & self.inv_mask) | ((field << self.low) & self.mask)
+
     def extract(self, word: int) -> int:
         """
         Args: word(int).
         Returns: value of the field.
         """
-        new_word = word
-        print(str(word) + ' is word')
-        if new_word > self.width:
-            #print(self.width)
-            new_word = new_word
-            print(str(new_word) + ' is new word,' + str(self.width) + ' is width')
-            print(hex(new_word))
-            print(hex(new_word & self.mask))
-            new_word = new_word & self.mask
-            # & (self.width - 1)
-            return new_word
-        if new_word < self.width:
-            new_word = new_word >> self.low
-            return new_word
-        return new_word & self.mask
+        return (word & self.mask) >> self.low
 
     def sign_extend(self, field: int, width: int) -> int:
         """Interpret field as a signed integer with width bits.
@@ -128,12 +83,17 @@ class BitField(object):
             return field
     
     def extract_signed(self, word: int) -> int:
-        new_word = self.sign_extend(word, self.high)
-        if new_word > self.width:
-            return new_word
-        if new_word < self.width:
-            new_word = new_word >> self.low
-        return new_word
+        """
+        Args: word(int).
+        Returns: value of the field, sign-extended if 
+        the high bit of the field is 1.
+        """
+        value = self.extract(word)
+        sign_bit = 1 << (self.width - 1)
+        # Flipping the sign bit and subtracting it back leaves a
+        # positive value unchanged and takes 2^width from a negative
+        # one, without a branch
+        return (value ^ sign_bit) - sign_bit
     # FIXME:
     #    The constructor should take two integers, from_bit and to_bit,
     #    indicating the bounds of the field.  Unlike a Python range, these
@@ -192,14 +152,15 @@ class BitField(object):
 #    the "sign bit", the highest bit in the field.
 #
 
-lowpart = BitField(0, 3)
-midpart = BitField(4, 6)
-highpart = BitField(7, 9)
-packed = 0
-packed = lowpart.insert(1, packed)
-packed = midpart.insert(1, packed)
-packed = highpart.insert(1, packed)
+if __name__ == "__main__":
+    lowpart = BitField(0, 3)
+    midpart = BitField(4, 6)
+    highpart = BitField(7, 9)
+    packed = 0
+    packed = lowpart.insert(1, packed)
+    packed = midpart.insert(1, packed)
+    packed = highpart.insert(1, packed)
 
-print(str(lowpart.extract(packed)) + ' is extract low part')
-print(str(midpart.extract(packed)) + ' is extract mid part')
-print(str(highpart.extract(packed)) + ' is extract high part')
+    print(str(lowpart.extract(packed)) + ' is extract low part')
+    print(str(midpart.extract(packed)) + ' is extract mid part')
+    print(str(highpart.extract(packed)) + ' is extract high part')
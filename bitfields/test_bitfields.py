@@ -69,6 +69,17 @@ class TestBitFields(unittest.TestCase):
         self.assertEqual(packed, 0xf0)
         # Note 0xf0 == 240
 
+    def test_extract_signed(self):
+        """Signed values survive insert and extract_signed,
+        down to a 1-bit field.
+        """
+        field = BitField(3, 9)
+        for value in range(-64, 64):
+            self.assertEqual(field.extract_signed(field.insert(value, 0xffffffff)), value)
+        flag = BitField(31, 31)
+        self.assertEqual(flag.extract_signed(1 << 31), -1)
+        self.assertEqual(flag.extract_signed(0x7fffffff), 0)
+
 
 
 if __name__ == '__main__':
@@ -16,23 +16,36 @@ representation, but we ignore that because we are trying
 to simulate a machine-level representation. 
 """
 
+from typing import Callable, Iterable, List, Sequence, Tuple
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 WORD_SIZE = 32 
+WORD_MASK = (1 << WORD_SIZE) - 1  # Ones in every bit of a word
 
 
 class BitField(object):
     """A BitField object handles insertion and 
     extraction of one field within an integer.
     """
+    __slots__ = ('from_bit', 'to_bit', 'field_width', 'value_mask',
+                 'field_mask', 'clear_mask', 'value_sign_bit')
+
     def __init__(self, from_bit, to_bit):
         self.from_bit = from_bit
         self.to_bit = to_bit
-        self.width = 2**(self.to_bit + 1)
-        self.mask = self.width -(2**from_bit)
+        # Field geometry, computed once so that insert and
+        # extract are just shifts and masks
+        self.field_width = to_bit - from_bit + 1
+        # Ones in the low field_width bits, for a value of the field
+        self.value_mask = (1 << self.field_width) - 1
+        # Ones in the field's own bits of a word
+        self.field_mask = self.value_mask << from_bit
+        # Ones in every other bit of the word
+        self.clear_mask = ~self.field_mask & WORD_MASK
+        # The field's high (sign) bit, in a value extracted from it
+        self.value_sign_bit = 1 << (self.field_width - 1)
 
     def insert(self, field: int, word:int):
         """
@@ -76,8 +89,15 @@ class BitField(object):
         self.assertEqual(low_4.insert(13, higher), 13 + higher)
         Passing in Bitfield(0,3), 1101, 1111 0000, returns 1111 1101
         Basically, inserts 1101 in to 1111 0000. So 0000 1101 | 1111 0000 = field | word
+
+        The old contents of the field are cleared first (word & clear_mask),
+        so inserting into a word that already has that field set replaces it:
+        Bitfield(4,7), 1111, xaa00aa00 returns xaa00aaf0
+        clear_mask has no bits beyond WORD_SIZE, so the result is always
+        a WORD_SIZE-bit unsigned word, even if word was wider or negative.
         """
-        return field << self.from_bit & self.mask | word
+        return (word & self.clear_mask) | ((field & self.value_mask) << self.from_bit)
+
     def extract(self, word: int):
         """
         Takes a word and returns value of field (i.e. bits in bitfield)
@@ -92,7 +112,7 @@ class BitField(object):
         self.assertEqual(mid_4.extract(15 << 4), 15)
         Passing through Bitfield(4,7), 1111 0000, should return 1111
         """
-        return word >> self.from_bit & self.mask
+        return (word >> self.from_bit) & self.value_mask
     
     def extract_signed(self, word: int):
         """
@@ -103,7 +123,32 @@ class BitField(object):
         # Doesn't clobber other bits
         Passing in Bitfield(0,3), 1111, return -1
         """
-        return sign_extend(word, self.to_bit) >> self.from_bit
+        value = (word >> self.from_bit) & self.value_mask
+        return (value ^ self.value_sign_bit) - self.value_sign_bit
+
+    def insert_batch(self, fields: Sequence[int], words: Sequence[int]) -> List[int]:
+        """
+        Like insert, applied pairwise to fields and words.
+        Returns the list of resulting words.
+        Raises ValueError if fields and words differ in length.
+        """
+        if len(fields) != len(words):
+            raise ValueError("{} fields for {} words".format(len(fields), len(words)))
+        clear_mask = self.clear_mask
+        value_mask = self.value_mask
+        from_bit = self.from_bit
+        return [(word & clear_mask) | ((field & value_mask) << from_bit)
+                for field, word in zip(fields, words)]
+
+    def extract_batch(self, words: Iterable[int]) -> List[int]:
+        """
+        Like extract, applied to each of words.
+        Returns the list of field values.
+        """
+        value_mask = self.value_mask
+        from_bit = self.from_bit
+        return [(word >> from_bit) & value_mask for word in words]
+
     # FIXME:
     #    The constructor should take two integers, from_bit and to_bit,
     #    indicating the bounds of the field.  Unlike a Python range, these
@@ -137,6 +182,51 @@ class BitField(object):
     #   the extract_signed method.
 
 
+class BitFieldSet(object):
+    """A fixed sequence of BitFields that are usually decoded
+    together, e.g., all the fields of an instruction word.
+    Fields listed in signed_fields are extracted as signed
+    values, like BitField.extract_signed; the rest unsigned.
+    """
+    def __init__(self, fields: Sequence[BitField],
+                 signed_fields: Iterable[BitField] = ()):
+        self.fields = tuple(fields)
+        signed_fields = set(signed_fields)
+        self.signed = tuple(field in signed_fields for field in self.fields)
+        self._geometry = tuple((field.from_bit, field.value_mask,
+                                field.value_sign_bit if signed else 0)
+                               for field, signed in zip(self.fields, self.signed))
+        self._unpack = build_unpacker(self.fields, signed_fields)
+
+    def extract(self, word: int) -> Tuple[int, ...]:
+        """
+        Args: word(int).
+        Returns: tuple of the values of each field, in order.
+        """
+        return self._unpack(word)
+
+    def extract_batch(self, words: Iterable[int]) -> List[Tuple[int, ...]]:
+        """
+        Like extract, applied to each of words.
+        """
+        unpack = self._unpack
+        return [unpack(word) for word in words]
+
+    def extract_columns(self, words: Sequence[int]) -> Tuple[List[int], ...]:
+        """
+        Like extract_batch, but arranged by field: a tuple with,
+        for each field in order, the list of its values in words.
+        """
+        columns = [ ]
+        for from_bit, value_mask, sign_bit in self._geometry:
+            if sign_bit:
+                columns.append([(((word >> from_bit) & value_mask) ^ sign_bit) - sign_bit
+                                for word in words])
+            else:
+                columns.append([(word >> from_bit) & value_mask for word in words])
+        return tuple(columns)
+
+
 # Sign extension is a little bit wacky in Python, because Python
 # doesn't really use 32-bit integers ... rather it uses a special
 # variable-length bit-string format, which makes *most* logical
@@ -161,23 +251,88 @@ class BitField(object):
 #    Sign extension distinguishes these cases by checking
 #    the "sign bit", the highest bit in the field.
 
+# Sign bit of a field of each width, indexed by width
+_SIGN_BITS = [0] + [1 << (width - 1) for width in range(1, WORD_SIZE + 1)]
+
 def sign_extend(field: int, width: int) -> int:
     """Interpret field as a signed integer with width bits.
     If the sign bit is zero, it is positive.  If the sign bit
     is negative, the result is sign-extended to be a negative
     integer in Python.
-    width must be 2 or greater. field must fit in width bits.
+    width must be 2 or greater, and at most WORD_SIZE.
+    field must fit in width bits.
+    """
+    assert 1 < width <= WORD_SIZE
+    assert 0 <= field < 1 << width
+    sign_bit = _SIGN_BITS[width] # will have form 1000... for width of field
+    mask = sign_bit - 1          # will have form 0111... for width of field
+    # field & sign_bit is 0 for a positive field and the sign bit's
+    # weight for a negative one, so no branch is needed; bits above
+    # the field are dropped by both masks
+    return (field & mask) - (field & sign_bit)
+
+
+def sign_extend_batch(fields: Iterable[int], width: int) -> List[int]:
+    """sign_extend applied to each of fields, all of the same width.
+    Returns the list of signed values.
+    Like sign_extend, each field must fit in width bits.
+    """
+    assert 1 < width <= WORD_SIZE
+    if __debug__:
+        # Checked in one pass before converting; python -O skips it
+        fields = list(fields)
+        limit = 1 << width
+        assert all(0 <= field < limit for field in fields)
+    sign_bit = _SIGN_BITS[width]
+    mask = sign_bit - 1
+    return [(field & mask) - (field & sign_bit) for field in fields]
+
+
+def compile_bitfield(bit_field: BitField
+                     ) -> Tuple[Callable[[int, int], int],
+                                Callable[[int], int],
+                                Callable[[int], int]]:
+    """Functions (insert, extract, extract_signed) behaving like
+    the methods of bit_field with the same names.  The field's
+    shift and masks are baked into each function as constants,
+    so a call does no attribute lookups; use these in loops
+    that handle many words.
+    """
+    from_bit = bit_field.from_bit
+    value_mask = bit_field.value_mask
+    clear_mask = bit_field.clear_mask
+    value_sign_bit = bit_field.value_sign_bit
+
+    def insert(field: int, word: int) -> int:
+        return (word & clear_mask) | ((field & value_mask) << from_bit)
+
+    def extract(word: int) -> int:
+        return (word >> from_bit) & value_mask
+
+    def extract_signed(word: int) -> int:
+        return (((word >> from_bit) & value_mask) ^ value_sign_bit) - value_sign_bit
+
+    return insert, extract, extract_signed
+
+
+def build_unpacker(fields: Sequence[BitField],
+                   signed_fields: Iterable[BitField] = ()
+                   ) -> Callable[[int], Tuple[int, ...]]:
+    """A function taking a word to the tuple of the values of
+    each of fields, in order, sign-extending those also in
+    signed_fields.  Its source is generated with the shifts
+    and masks written out as literals, e.g.,
+        def unpack(word): return ((word >> 0) & 0xf, (word >> 4) & 0x7,)
+    so decoding a word is one straight-line expression.
     """
-    log.debug("Sign extending {} ({}) in field of {} bits".format(field, bin(field), width))
-    assert width > 1
-    assert field >= 0 and field < 1 << (width + 1)
-    sign_bit = 1 << (width - 1) # will have form 1000... for width of field
-    mask = sign_bit - 1         # will have form 0111... for width of field
-    if (field & sign_bit):
-        # It's negative; sign extend it
-        log.debug("Complementing by subtracting 2^{}={}".format(width-1,sign_bit))
-        extended = (field & mask) - sign_bit
-        log.debug("Should return {} ({})".format(extended, bin(extended)))
-        return extended
-    else:
-        return field
\ No newline at end of file
+    signed_fields = set(signed_fields)
+    parts = [ ]
+    for field in fields:
+        part = "(word >> {}) & {:#x}".format(field.from_bit, field.value_mask)
+        if field in signed_fields:
+            part = "(({}) ^ {sign:#x}) - {sign:#x}".format(part, sign=field.value_sign_bit)
+        parts.append(part + ", ")
+    parts = "".join(parts)
+    namespace = { }
+    exec("def unpack(word): return ({})".format(parts), namespace)
+    return namespace["unpack"]
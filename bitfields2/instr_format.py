@@ -11,7 +11,7 @@ range -2^11 to 2^11 - 1.
 See docs/duck_machine.md for details. 
 """
 
-from bitfield import BitField
+from bitfield import BitField, BitFieldSet
 from enum import Enum, Flag
 
 # The field bit positions
@@ -23,6 +23,11 @@ reg_src1_field = BitField(14, 17)
 reg_src2_field = BitField(10, 13)
 offset_field = BitField(0, 9)
 
+# All the fields decoded from an instruction word, in one step
+instr_fields = BitFieldSet([instr_field, cond_field, reg_target_field,
+                            reg_src1_field, reg_src2_field, offset_field],
+                           signed_fields=[offset_field])
+
 
 # The following operation codes control both the ALU and some
 # other parts of the CPU.  Only the ALU is modeled in the
@@ -151,12 +156,7 @@ class Instruction(object):
 #
 def decode(word: int) -> Instruction:
     """Decode a memory word (32 bit int) into a new Instruction"""
-    op = instr_field.extract(word)
-    cond = cond_field.extract(word)
-    reg_target = reg_target_field.extract(word)
-    reg_src1 = reg_src1_field.extract(word)
-    reg_src2 = reg_src2_field.extract(word)
-    offset = offset_field.extract_signed(word)
+    op, cond, reg_target, reg_src1, reg_src2, offset = instr_fields.extract(word)
     return Instruction(OpCode(op), CondFlag(cond),
                        reg_target, reg_src1, reg_src2, offset)
 
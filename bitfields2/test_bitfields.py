@@ -58,6 +58,12 @@ class TestBitFields(unittest.TestCase):
         packed = field.insert(newval, packed)
         self.assertEqual(packed, 0x50)  # 01010000 --- some zeros replaced 1s
         # Note 0x50 == 0b01010000 == 80
+        # Bits on both sides of the field are kept
+        self.assertEqual(field.insert(0xf, 0xaa00aa00), 0xaa00aaf0)
+        self.assertEqual(field.insert(0x0, 0xffffffff), 0xffffff0f)
+        # Bits beyond the 32-bit word are dropped
+        self.assertEqual(field.insert(0x5, 0x1ffffffff), 0xffffff5f)
+        self.assertEqual(field.insert(0x5, -1), 0xffffff5f)
 
     def test_width(self):
         """Make sure we are masking out any bits that don't fit in 
@@ -69,6 +75,70 @@ class TestBitFields(unittest.TestCase):
         self.assertEqual(packed, 0xf0)
         # Note 0xf0 == 240
 
+    def test_signed_round_trip(self):
+        """Negative and positive values survive insert and
+        extract_signed, whatever the surrounding bits are.
+        """
+        field = BitField(3, 9)
+        for value in range(-64, 64):
+            packed = field.insert(value, 0xffffffff)
+            self.assertEqual(field.extract_signed(packed), value)
+            packed = field.insert(value, 0)
+            self.assertEqual(field.extract_signed(packed), value)
+
+    def test_batch(self):
+        """Batch operations agree with one word at a time"""
+        field = BitField(4, 9)
+        words = [0, 0xffffffff, 0xaa00aa00, 0x3f0, 0x12345678]
+        values = [0, 63, 21, 64, 7]
+        self.assertEqual(field.insert_batch(values, words),
+                         [field.insert(v, w) for v, w in zip(values, words)])
+        self.assertEqual(field.extract_batch(words),
+                         [field.extract(w) for w in words])
+        with self.assertRaises(ValueError):
+            field.insert_batch(values[:-1], words)
+
+    def test_compiled(self):
+        """Compiled functions agree with the methods"""
+        field = BitField(4, 9)
+        insert, extract, extract_signed = bitfield.compile_bitfield(field)
+        for word in [0, 0xffffffff, 0xaa00aa00, 0x12345678]:
+            for value in [0, 21, 63, -1, -32, 100]:
+                self.assertEqual(insert(value, word), field.insert(value, word))
+            self.assertEqual(extract(word), field.extract(word))
+            self.assertEqual(extract_signed(word), field.extract_signed(word))
+
+
+class TestBitFieldSet(unittest.TestCase):
+
+    def test_extract(self):
+        fields = [BitField(0, 3), BitField(4, 6), BitField(7, 9)]
+        field_set = bitfield.BitFieldSet(fields)
+        for word in [0, 0x3ff, 0x2a5, 0xffffffff]:
+            self.assertEqual(field_set.extract(word),
+                             tuple(field.extract(word) for field in fields))
+        self.assertEqual(field_set.extract_batch([0x3ff, 0]),
+                         [(15, 7, 7), (0, 0, 0)])
+        self.assertEqual(field_set.extract_columns([0x3ff, 0, 0x2a5]),
+                         ([15, 0, 5], [7, 0, 2], [7, 0, 5]))
+
+    def test_unpacker(self):
+        fields = [BitField(26, 30), BitField(0, 9)]
+        unpack = bitfield.build_unpacker(fields)
+        self.assertEqual(unpack(0xffffffff), (31, 1023))
+        self.assertEqual(unpack(0x08000005), (2, 5))
+        self.assertEqual(bitfield.build_unpacker([])(0xffffffff), ())
+
+    def test_signed_fields(self):
+        low, high = BitField(0, 3), BitField(4, 9)
+        field_set = bitfield.BitFieldSet([low, high], signed_fields=[high])
+        words = [0, 0x3ff, 0x1f5, 0x20a]
+        self.assertEqual(field_set.extract_batch(words),
+                         [(low.extract(word), high.extract_signed(word))
+                          for word in words])
+        self.assertEqual(field_set.extract_columns(words),
+                         ([0, 15, 5, 10], [0, -1, 31, -32]))
+
 
 class TestSignExtension(unittest.TestCase):
     """Testing the sign extension function.  If you move sign extension into
@@ -92,6 +162,22 @@ class TestSignExtension(unittest.TestCase):
         self.assertEqual(bitfield.sign_extend(13, 4), -3)
         self.assertEqual(bitfield.sign_extend(13, 5), 13)
 
+    def test_field_too_wide(self):
+        """A field with bits beyond its width is rejected"""
+        with self.assertRaises(AssertionError):
+            bitfield.sign_extend(16, 4)
+        with self.assertRaises(AssertionError):
+            bitfield.sign_extend(-1, 4)
+        with self.assertRaises(AssertionError):
+            bitfield.sign_extend_batch([7, 16], 4)
+        with self.assertRaises(AssertionError):
+            bitfield.sign_extend_batch(iter([-1]), 4)
+
+    def test_batch(self):
+        self.assertEqual(bitfield.sign_extend_batch([7, 11, 13, 0, 8], 4),
+                         [7, -5, -3, 0, -8])
+        self.assertEqual(bitfield.sign_extend_batch([], 4), [])
+
 
 if __name__ == '__main__':
     unittest.main()